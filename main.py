@@ -1,16 +1,40 @@
-from typing import TypedDict, Optional, Dict, Any, List, Annotated
+from typing import TypedDict, Optional, Dict, Any, List, Annotated, FrozenSet
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import os
+import re
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 from langgraph.graph import StateGraph, START, END
-from langgraph.types import Send
+from numba import njit
+from pytdigest import TDigest
 
 
 def merge_statistics(existing: Optional[Dict[str, Dict[str, Any]]], new: Optional[Dict[str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
     if existing is None:
         existing = {}
-    if new is None:
-        return existing
-    return {**existing, **new}
+    if new:
+        existing.update(new)
+    return existing
+
+
+_NORM_RE = re.compile(r'[\W_]+')
+
+STREAMING_THRESHOLD_BYTES = 1024 ** 3
+MODE_CAPACITY = 1024
+HLL_PRECISION = 14
+TDIGEST_COMPRESSION = 1000
+
+_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+_TRUE_VALUES = ["True", "TRUE", "true"]
+_FALSE_VALUES = ["False", "FALSE", "false"]
 
 
 class EDState(TypedDict):
@@ -18,18 +42,69 @@ class EDState(TypedDict):
     df: Optional[pd.DataFrame]
     original_headers: Optional[List[str]]
     normalized_headers: Optional[Dict[str, str]]
+    numeric_columns: Optional[FrozenSet[str]]
+    text_columns: Optional[FrozenSet[str]]
     statistics: Annotated[Optional[Dict[str, Dict[str, Any]]], merge_statistics]
+    streaming: Optional[bool]
+    row_count: Optional[int]
     error: Optional[str]
 
 
-class ColumnAnalysisState(TypedDict):
-    file_path: str
-    df: Optional[pd.DataFrame]
-    original_headers: Optional[List[str]]
-    normalized_headers: Optional[Dict[str, str]]
-    statistics: Annotated[Optional[Dict[str, Dict[str, Any]]], merge_statistics]
-    error: Optional[str]
-    column_name: str
+def _schema_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.schema.arrow")
+
+
+def _read_schema(path: Path) -> Optional[Dict[str, pa.DataType]]:
+    schema_path = _schema_path(path)
+    if not schema_path.exists() or schema_path.stat().st_mtime < path.stat().st_mtime:
+        return None
+    
+    try:
+        schema = pa.ipc.read_schema(pa.py_buffer(schema_path.read_bytes()))
+    except (OSError, pa.ArrowException):
+        return None
+    return {field.name: field.type for field in schema}
+
+
+def _write_schema(path: Path, df: pd.DataFrame):
+    schema = pa.schema([
+        (str(column), dtype.pyarrow_dtype)
+        for column, dtype in df.dtypes.items()
+        if isinstance(dtype, pd.ArrowDtype)
+    ])
+    try:
+        _schema_path(path).write_bytes(schema.serialize().to_pybytes())
+    except OSError:
+        pass
+
+
+def _csv_convert_options(column_types: Optional[Dict[str, pa.DataType]] = None) -> pa_csv.ConvertOptions:
+    return pa_csv.ConvertOptions(
+        column_types=column_types,
+        null_values=_NA_VALUES,
+        true_values=_TRUE_VALUES,
+        false_values=_FALSE_VALUES,
+        strings_can_be_null=True,
+    )
+
+
+def _read_arrow_csv(path: Path, column_names: List[str], column_types: Optional[Dict[str, pa.DataType]] = None) -> pd.DataFrame:
+    read_options = pa_csv.ReadOptions(column_names=column_names, skip_rows=1)
+    table = pa_csv.read_csv(path, read_options=read_options, convert_options=_csv_convert_options(column_types))
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _read_csv(path: Path) -> pd.DataFrame:
+    column_types = _read_schema(path)
+    if column_types:
+        try:
+            return _read_arrow_csv(path, list(column_types), column_types)
+        except pa.ArrowInvalid:
+            pass
+    
+    df = _read_arrow_csv(path, pd.read_csv(path, nrows=0).columns.tolist())
+    _write_schema(path, df)
+    return df
 
 
 def load_file(state: EDState) -> Dict[str, Any]:
@@ -40,10 +115,13 @@ def load_file(state: EDState) -> Dict[str, Any]:
         return {"error": f"File not found: {file_path}"}
     
     try:
-        if path.suffix.lower() == '.csv':
-            df = pd.read_csv(file_path)
+        if path.suffix.lower() == '.csv' and path.stat().st_size > STREAMING_THRESHOLD_BYTES:
+            df = pd.read_csv(file_path, nrows=0)
+            return {"df": df, "streaming": True, "error": None}
+        elif path.suffix.lower() == '.csv':
+            df = _read_csv(path)
         elif path.suffix.lower() in ['.xlsx', '.xls']:
-            df = pd.read_excel(file_path)
+            df = pd.read_excel(file_path, engine='calamine', dtype_backend='pyarrow')
         else:
             return {"error": f"Unsupported file format: {path.suffix}. Use CSV or Excel files."}
         
@@ -52,6 +130,35 @@ def load_file(state: EDState) -> Dict[str, Any]:
         return {"error": f"Error loading file: {str(e)}"}
 
 
+def _reduce_series(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_integer_dtype(series):
+        return pd.to_numeric(series, downcast='integer')
+    
+    if pd.api.types.is_float_dtype(series):
+        downcast = pd.to_numeric(series, downcast='float')
+        return downcast if downcast.astype(series.dtype).equals(series) else series
+    
+    if pd.api.types.is_string_dtype(series) or pd.api.types.is_object_dtype(series):
+        if len(series) > 0 and series.nunique() / len(series) < 0.5:
+            return series.astype('category')
+    
+    return series
+
+
+def reduce_memory(state: EDState) -> Dict[str, Any]:
+    if state.get("error"):
+        return {}
+    
+    df = state["df"]
+    if df is None:
+        return {"error": "No dataframe available"}
+    
+    for column in df.columns:
+        df[column] = _reduce_series(df[column])
+    
+    return {"df": df}
+
+
 def identify_headers(state: EDState) -> Dict[str, Any]:
     if state.get("error"):
         return {}
@@ -72,87 +179,382 @@ def normalize_headers(state: EDState) -> Dict[str, Any]:
     if not original_headers:
         return {"error": "No headers found"}
     
-    normalized = {}
-    for header in original_headers:
-        normalized_name = str(header).lower().strip()
-        normalized_name = normalized_name.replace(' ', '_')
-        normalized_name = ''.join(c if c.isalnum() or c == '_' else '_' for c in normalized_name)
-        normalized_name = '_'.join(filter(None, normalized_name.split('_')))
-        normalized[header] = normalized_name
+    normalized = {
+        header: _NORM_RE.sub('_', str(header).lower().strip()).strip('_')
+        for header in original_headers
+    }
     
     df = state["df"]
-    df.columns = [normalized[col] for col in df.columns]
+    df.rename(columns=normalized, inplace=True)
+    numeric_columns = frozenset(df.select_dtypes(include=np.number).columns)
+    text_columns = frozenset(column for column, series in df.items() if _is_text(series))
     
-    return {"normalized_headers": normalized, "df": df}
+    return {
+        "normalized_headers": normalized,
+        "numeric_columns": numeric_columns,
+        "text_columns": text_columns,
+        "df": df,
+    }
 
 
-def fan_out_columns(state: EDState) -> List[Send]:
-    if state.get("error"):
-        return []
+@njit(cache=True, nogil=True)
+def _fused_stats(column: np.ndarray):
+    x = column[~np.isnan(column)]
+    n = x.size
+    if n == 0:
+        return np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan
     
-    df = state["df"]
-    if df is None:
+    mn = x[0]
+    mx = x[0]
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        v = x[i]
+        if v < mn:
+            mn = v
+        if v > mx:
+            mx = v
+        delta = v - mean
+        mean += delta / (i + 1)
+        m2 += delta * (v - mean)
+    if np.isinf(mn) or np.isinf(mx):
+        mean = mn + mx
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    
+    positions = np.array([0.25, 0.5, 0.75]) * (n - 1)
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.ceil(positions).astype(np.int64)
+    part = np.partition(x, np.unique(np.concatenate((lower, upper))))
+    quantiles = part[lower] + (part[upper] - part[lower]) * (positions - lower)
+    
+    return mn, mx, mean, std, quantiles[0], quantiles[1], quantiles[2]
+
+
+def _arrow_strings(values: pd.Series) -> pa.Array:
+    if isinstance(values.dtype, (pd.ArrowDtype, pd.StringDtype)):
+        arr = pa.array(values)
+        if pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type):
+            return arr.cast(pa.large_string())
+    
+    return pa.array(values.astype(str), type=pa.large_string())
+
+
+def _length_stats(columns: List[pd.Series]) -> List[Dict[str, Any]]:
+    if not columns:
         return []
     
+    sizes = np.array([len(values) for values in columns])
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    strings = pa.chunked_array([_arrow_strings(values) for values in columns], type=pa.large_string())
+    lengths = pc.utf8_length(strings).to_numpy()
+    
+    min_lengths = np.minimum.reduceat(lengths, starts)
+    max_lengths = np.maximum.reduceat(lengths, starts)
+    avg_lengths = np.add.reduceat(lengths, starts) / sizes
     return [
-        Send("analyze_column", {**state, "column_name": column})
-        for column in df.columns
+        {
+            "min_length": int(min_lengths[j]),
+            "max_length": int(max_lengths[j]),
+            "avg_length": float(avg_lengths[j]),
+        }
+        for j in range(len(columns))
     ]
 
 
-def analyze_column(state: ColumnAnalysisState) -> Dict[str, Any]:
+def _kernel_dtype(dtype: Any) -> type:
+    np_dtype = np.dtype(getattr(dtype, "numpy_dtype", dtype))
+    if (np_dtype.kind == "f" and np_dtype.itemsize <= 4) or (np_dtype.kind in "iu" and np_dtype.itemsize <= 2):
+        return np.float32
+    return np.float64
+
+
+def _is_temporal(dtype: Any) -> bool:
+    if isinstance(dtype, pd.ArrowDtype):
+        return pa.types.is_temporal(dtype.pyarrow_dtype)
+    return pd.api.types.is_datetime64_any_dtype(dtype) or pd.api.types.is_timedelta64_dtype(dtype)
+
+
+def _optional_float(value: float) -> Optional[float]:
+    return float(value) if not np.isnan(value) else None
+
+
+def _is_text(series: pd.Series) -> bool:
+    return (
+        pd.api.types.is_string_dtype(series)
+        or pd.api.types.is_object_dtype(series)
+        or isinstance(series.dtype, pd.CategoricalDtype)
+        or _is_temporal(series.dtype)
+    )
+
+
+def _most_common(non_null_values: pd.Series) -> Optional[str]:
+    if len(non_null_values) == 0:
+        return None
+    codes, uniques = pd.factorize(non_null_values)
+    return str(uniques[np.bincount(codes).argmax()])
+
+
+def analyze_numeric_block(state: EDState) -> Dict[str, Any]:
+    if state.get("error") or state.get("df") is None:
+        return {}
+    
+    df = state["df"]
+    num_df = df.loc[:, df.columns.isin(state["numeric_columns"])]
+    if num_df.shape[1] == 0:
+        return {}
+    
+    kernel_dtypes = [_kernel_dtype(dtype) for dtype in num_df.dtypes]
+    block_stats: List[Any] = [None] * num_df.shape[1]
+    null_counts = np.zeros(num_df.shape[1], dtype=np.int64)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for kernel_dtype in (np.float32, np.float64):
+            positions = [j for j, dtype in enumerate(kernel_dtypes) if dtype == kernel_dtype]
+            if not positions:
+                continue
+            block = np.empty((len(positions), num_df.shape[0]), dtype=kernel_dtype)
+            for row, j in enumerate(positions):
+                block[row] = num_df.iloc[:, j].to_numpy(dtype=kernel_dtype, na_value=np.nan, copy=False)
+            for j, column_stats in zip(positions, executor.map(_fused_stats, block)):
+                block_stats[j] = column_stats
+            null_counts[positions] = np.isnan(block).sum(axis=1)
+    unique_counts = num_df.nunique()
+    
+    statistics = {}
+    for j, column in enumerate(num_df.columns):
+        mn, mx, mean, std, q25, median, q75 = block_stats[j]
+        statistics[column] = {
+            "dtype": str(num_df.dtypes.iloc[j]),
+            "count": int(len(num_df) - null_counts[j]),
+            "null_count": int(null_counts[j]),
+            "unique_count": int(unique_counts.iloc[j]),
+            "min": _optional_float(mn),
+            "max": _optional_float(mx),
+            "mean": _optional_float(mean),
+            "median": _optional_float(median),
+            "std": _optional_float(std),
+            "q25": _optional_float(q25),
+            "q75": _optional_float(q75),
+        }
+    
+    return {"statistics": statistics}
+
+
+def analyze_object_block(state: EDState) -> Dict[str, Any]:
+    if state.get("error") or state.get("df") is None:
+        return {}
+    
     df = state["df"]
-    column = state["column_name"]
+    obj_df = df.loc[:, ~df.columns.isin(state["numeric_columns"])]
+    if obj_df.shape[1] == 0:
+        return {}
+    
+    null_counts = obj_df.isnull().sum()
+    unique_counts = obj_df.nunique()
+    non_null_text = {}
+    for column, series in obj_df.items():
+        if column in state["text_columns"]:
+            non_null_values = series.dropna()
+            if len(non_null_values) > 0:
+                non_null_text[column] = non_null_values
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        most_common = executor.map(_most_common, non_null_text.values())
+        length_stats = _length_stats(list(non_null_text.values()))
+        text_stats = {
+            column: {"most_common": value, **lengths}
+            for column, value, lengths in zip(non_null_text, most_common, length_stats)
+        }
+    
+    statistics = {}
+    for j, column in enumerate(obj_df.columns):
+        statistics[column] = {
+            "dtype": str(obj_df.dtypes.iloc[j]),
+            "count": int(len(obj_df) - null_counts.iloc[j]),
+            "null_count": int(null_counts.iloc[j]),
+            "unique_count": int(unique_counts.iloc[j]),
+            **text_stats.get(column, {}),
+        }
+    
+    return {"statistics": statistics}
+
+
+def _new_accumulator(dtype: pa.DataType) -> Dict[str, Any]:
+    return {
+        "dtype": dtype,
+        "rows": 0,
+        "count": 0,
+        "registers": np.zeros(1 << HLL_PRECISION, dtype=np.uint8),
+        "mean": 0.0,
+        "m2": 0.0,
+        "min": np.inf,
+        "max": -np.inf,
+        "digest": TDigest(TDIGEST_COMPRESSION),
+        "modes": {},
+        "min_length": None,
+        "max_length": None,
+        "total_length": 0,
+    }
+
+
+def _is_numeric_type(dtype: pa.DataType) -> bool:
+    return pa.types.is_integer(dtype) or pa.types.is_floating(dtype)
+
+
+def _is_text_type(dtype: pa.DataType) -> bool:
+    return pa.types.is_string(dtype) or pa.types.is_large_string(dtype) or pa.types.is_temporal(dtype)
+
+
+def _update_registers(registers: np.ndarray, values: np.ndarray):
+    hashes = pd.util.hash_array(values)
+    index = (hashes >> np.uint64(64 - HLL_PRECISION)).astype(np.intp)
+    low = (hashes & np.uint64((1 << (64 - HLL_PRECISION)) - 1)) | np.uint64(1 << (64 - HLL_PRECISION))
+    rank = np.log2((low & (~low + np.uint64(1))).astype(np.float64)).astype(np.uint8) + 1
+    np.maximum.at(registers, index, rank)
+
+
+def _estimate_unique(registers: np.ndarray) -> int:
+    m = registers.size
+    estimate = 0.7213 / (1 + 1.079 / m) * m * m / np.exp2(-registers.astype(np.float64)).sum()
+    zeros = int(np.count_nonzero(registers == 0))
+    if estimate <= 2.5 * m and zeros > 0:
+        estimate = m * np.log(m / zeros)
+    return int(round(estimate))
+
+
+def _update_modes(modes: Dict[Any, int], values: np.ndarray) -> Dict[Any, int]:
+    codes, uniques = pd.factorize(values)
+    counts = np.bincount(codes)
+    if len(counts) > MODE_CAPACITY:
+        cutoff = np.partition(counts, -(MODE_CAPACITY + 1))[-(MODE_CAPACITY + 1)]
+        keep = counts > cutoff
+        uniques, counts = uniques[keep], counts[keep] - cutoff
+    
+    for value, count in zip(uniques.tolist(), counts.tolist()):
+        modes[value] = modes.get(value, 0) + count
+    if len(modes) > MODE_CAPACITY:
+        cutoff = sorted(modes.values(), reverse=True)[MODE_CAPACITY]
+        modes = {value: count - cutoff for value, count in modes.items() if count > cutoff}
+    return modes
+
+
+def _accumulate(acc: Dict[str, Any], array: pa.Array):
+    values = pc.drop_null(array)
+    acc["rows"] += len(array)
+    acc["count"] += len(values)
+    if len(values) == 0:
+        return
     
+    if _is_numeric_type(acc["dtype"]):
+        x = values.to_numpy(zero_copy_only=False).astype(np.float64, copy=False)
+        n_b, n = len(x), acc["count"]
+        mean_b = x.mean()
+        delta = mean_b - acc["mean"]
+        acc["mean"] += delta * n_b / n
+        acc["m2"] += float(((x - mean_b) ** 2).sum()) + delta ** 2 * (n - n_b) * n_b / n
+        acc["min"] = min(acc["min"], float(x.min()))
+        acc["max"] = max(acc["max"], float(x.max()))
+        acc["digest"].update(x if n_b > 1 else float(x[0]))
+        _update_registers(acc["registers"], x)
+    elif _is_text_type(acc["dtype"]):
+        strings = values.cast(pa.large_string())
+        lengths = pc.utf8_length(strings)
+        length_range = pc.min_max(lengths)
+        chunk_min, chunk_max = length_range["min"].as_py(), length_range["max"].as_py()
+        acc["min_length"] = chunk_min if acc["min_length"] is None else min(acc["min_length"], chunk_min)
+        acc["max_length"] = chunk_max if acc["max_length"] is None else max(acc["max_length"], chunk_max)
+        acc["total_length"] += pc.sum(lengths).as_py()
+        objects = strings.to_numpy(zero_copy_only=False)
+        _update_registers(acc["registers"], objects)
+        acc["modes"] = _update_modes(acc["modes"], objects)
+    else:
+        _update_registers(acc["registers"], values.to_numpy(zero_copy_only=False))
+
+
+def _finalize(acc: Dict[str, Any]) -> Dict[str, Any]:
+    n = acc["count"]
     col_stats = {
-        "dtype": str(df[column].dtype),
-        "count": int(df[column].count()),
-        "null_count": int(df[column].isnull().sum()),
-        "unique_count": int(df[column].nunique())
+        "dtype": str(pd.ArrowDtype(acc["dtype"])),
+        "count": n,
+        "null_count": acc["rows"] - n,
+        "unique_count": _estimate_unique(acc["registers"]),
     }
     
-    if pd.api.types.is_numeric_dtype(df[column]):
+    if _is_numeric_type(acc["dtype"]):
+        if n > 0:
+            mn, mx = acc["min"], acc["max"]
+            q25, median, q75 = acc["digest"].inverse_cdf([0.25, 0.5, 0.75])
+            std = np.sqrt(acc["m2"] / (n - 1)) if n > 1 else np.nan
+            mean = mn + mx if np.isinf(mn) or np.isinf(mx) else acc["mean"]
+        else:
+            mn = mx = mean = std = q25 = median = q75 = np.nan
+        col_stats.update({
+            "min": _optional_float(mn),
+            "max": _optional_float(mx),
+            "mean": _optional_float(mean),
+            "median": _optional_float(median),
+            "std": _optional_float(std),
+            "q25": _optional_float(q25),
+            "q75": _optional_float(q75),
+        })
+    elif _is_text_type(acc["dtype"]) and n > 0:
         col_stats.update({
-            "min": float(df[column].min()) if pd.notna(df[column].min()) else None,
-            "max": float(df[column].max()) if pd.notna(df[column].max()) else None,
-            "mean": float(df[column].mean()) if pd.notna(df[column].mean()) else None,
-            "median": float(df[column].median()) if pd.notna(df[column].median()) else None,
-            "std": float(df[column].std()) if pd.notna(df[column].std()) else None,
-            "q25": float(df[column].quantile(0.25)) if pd.notna(df[column].quantile(0.25)) else None,
-            "q75": float(df[column].quantile(0.75)) if pd.notna(df[column].quantile(0.75)) else None,
+            "most_common": str(max(acc["modes"], key=acc["modes"].get)),
+            "min_length": acc["min_length"],
+            "max_length": acc["max_length"],
+            "avg_length": acc["total_length"] / n,
         })
-    elif pd.api.types.is_string_dtype(df[column]) or pd.api.types.is_object_dtype(df[column]):
-        non_null_values = df[column].dropna()
-        if len(non_null_values) > 0:
-            col_stats.update({
-                "most_common": str(non_null_values.mode()[0]) if len(non_null_values.mode()) > 0 else None,
-                "min_length": int(non_null_values.astype(str).str.len().min()),
-                "max_length": int(non_null_values.astype(str).str.len().max()),
-                "avg_length": float(non_null_values.astype(str).str.len().mean()),
-            })
     
-    return {"statistics": {column: col_stats}}
+    return col_stats
+
+
+def stream_statistics(state: EDState) -> Dict[str, Any]:
+    if state.get("error"):
+        return {}
+    
+    read_options = pa_csv.ReadOptions(column_names=list(state["df"].columns), skip_rows=1)
+    try:
+        reader = pa_csv.open_csv(state["file_path"], read_options=read_options, convert_options=_csv_convert_options())
+        accumulators = [_new_accumulator(field.type) for field in reader.schema]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for batch in reader:
+                list(executor.map(_accumulate, accumulators, batch.columns))
+    except Exception as e:
+        return {"error": f"Error streaming file: {str(e)}"}
+    
+    statistics = {field.name: _finalize(acc) for field, acc in zip(reader.schema, accumulators)}
+    row_count = accumulators[0]["rows"] if accumulators else 0
+    return {"statistics": statistics, "row_count": row_count}
 
 
-def aggregate_statistics(state: EDState) -> Dict[str, Any]:
-    return {}
+def route_analysis(state: EDState) -> List[str]:
+    if state.get("streaming"):
+        return ["stream_statistics"]
+    return ["analyze_numeric_block", "analyze_object_block"]
 
 
+@lru_cache(maxsize=1)
 def create_eda_graph():
     builder = StateGraph(EDState)
     
     builder.add_node("load_file", load_file)
+    builder.add_node("reduce_memory", reduce_memory)
     builder.add_node("identify_headers", identify_headers)
     builder.add_node("normalize_headers", normalize_headers)
-    builder.add_node("analyze_column", analyze_column)
-    builder.add_node("aggregate_statistics", aggregate_statistics)
+    builder.add_node("analyze_numeric_block", analyze_numeric_block)
+    builder.add_node("analyze_object_block", analyze_object_block)
+    builder.add_node("stream_statistics", stream_statistics)
     
     builder.add_edge(START, "load_file")
-    builder.add_edge("load_file", "identify_headers")
+    builder.add_edge("load_file", "reduce_memory")
+    builder.add_edge("reduce_memory", "identify_headers")
     builder.add_edge("identify_headers", "normalize_headers")
-    builder.add_conditional_edges("normalize_headers", fan_out_columns, ["analyze_column"])
-    builder.add_edge("analyze_column", "aggregate_statistics")
-    builder.add_edge("aggregate_statistics", END)
+    builder.add_conditional_edges(
+        "normalize_headers",
+        route_analysis,
+        ["analyze_numeric_block", "analyze_object_block", "stream_statistics"],
+    )
+    builder.add_edge("analyze_numeric_block", END)
+    builder.add_edge("analyze_object_block", END)
+    builder.add_edge("stream_statistics", END)
     
     return builder.compile()
 
@@ -167,7 +569,10 @@ def print_results(result: EDState):
         return
     
     print(f"\n📁 File: {result['file_path']}")
-    print(f"📊 Shape: {result['df'].shape if result.get('df') is not None else 'N/A'}")
+    if result.get("streaming"):
+        print(f"📊 Shape: ({result.get('row_count')}, {len(result['df'].columns)}) (streamed)")
+    else:
+        print(f"📊 Shape: {result['df'].shape if result.get('df') is not None else 'N/A'}")
     
     print("\n" + "-"*80)
     print("ORIGINAL HEADERS:")
@@ -185,7 +590,9 @@ def print_results(result: EDState):
     print("COLUMN STATISTICS:")
     print("-"*80)
     
-    for column, stats in result.get("statistics", {}).items():
+    statistics = result.get("statistics") or {}
+    for column in result["df"].columns:
+        stats = statistics[column]
         print(f"\n📊 {column}")
         print(f"   Type: {stats['dtype']}")
         print(f"   Count: {stats['count']} | Null: {stats['null_count']} | Unique: {stats['unique_count']}")
@@ -195,8 +602,9 @@ def print_results(result: EDState):
             print(f"   Mean: {stats['mean']:.2f} | Median: {stats['median']:.2f}" if stats['mean'] is not None else "   Mean: N/A | Median: N/A")
             print(f"   Std: {stats['std']:.2f}" if stats['std'] is not None else "   Std: N/A")
             print(f"   Q25: {stats['q25']:.2f} | Q75: {stats['q75']:.2f}" if stats['q25'] is not None else "   Q25: N/A | Q75: N/A")
-        elif "most_common" in stats and stats['most_common'] is not None:
-            print(f"   Most Common: {stats['most_common']}")
+        elif "min_length" in stats:
+            if stats['most_common'] is not None:
+                print(f"   Most Common: {stats['most_common']}")
             print(f"   Length Range: {stats['min_length']} - {stats['max_length']} (avg: {stats['avg_length']:.1f})")
     
     print("\n" + "="*80)
@@ -208,10 +616,10 @@ def main():
     print("\n🚀 EDA Graph with LangGraph")
     print("This graph processes CSV/Excel files through the following steps:")
     print("  1. Load file (CSV or Excel)")
-    print("  2. Identify headers")
-    print("  3. Normalize headers")
-    print("  4. Analyze each column in parallel ⚡")
-    print("  5. Aggregate statistics")
+    print("  2. Reduce memory (downcast numeric, categorize text)")
+    print("  3. Identify headers")
+    print("  4. Normalize headers")
+    print("  5. Analyze numeric and text column blocks in parallel ⚡")
     
     file_path = input("\nEnter the path to your CSV or Excel file: ").strip()
     
@@ -220,15 +628,16 @@ def main():
 
 
 if __name__ == "__main__":
-    graph = create_eda_graph()
-    
-    try:
-        graph_image = graph.get_graph().draw_mermaid_png()
-        with open("eda_graph.png", "wb") as f:
-            f.write(graph_image)
-        print("📊 Graph visualization saved to: eda_graph.png")
-    except Exception as e:
-        print(f"⚠️  Could not generate graph visualization: {e}")
-        print("   (This is optional - the graph will still work)")
+    if not Path("eda_graph.png").exists():
+        graph = create_eda_graph()
+        
+        try:
+            graph_image = graph.get_graph().draw_mermaid_png()
+            with open("eda_graph.png", "wb") as f:
+                f.write(graph_image)
+            print("📊 Graph visualization saved to: eda_graph.png")
+        except Exception as e:
+            print(f"⚠️  Could not generate graph visualization: {e}")
+            print("   (This is optional - the graph will still work)")
     
     main()
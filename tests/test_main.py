@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+import main
+
+
+MIXED_CSV = """Id,Flag,When,Amount,Label
+1,True,2024-01-01,NA,None
+2,false,,1.5,<NA>
+
+3,,2024-03-01,,x
+4,TRUE,2024-01-01,2.5,N/A
+"""
+
+DUPLICATE_HEADERS_CSV = """a,b,a
+1,NA,x
+,,
+3,None,y
+"""
+
+
+def run_graph(path):
+    return main.create_eda_graph().invoke({"file_path": str(path)})
+
+
+@pytest.mark.parametrize("content", [MIXED_CSV, DUPLICATE_HEADERS_CSV], ids=["mixed", "duplicate_headers"])
+def test_schema_sidecar_run_matches_first_run(tmp_path, content):
+    path = tmp_path / "data.csv"
+    path.write_text(content)
+    
+    first = run_graph(path)
+    assert first.get("error") is None
+    assert main._schema_path(path).exists()
+    
+    second = run_graph(path)
+    assert second.get("error") is None
+    assert list(second["df"].columns) == list(first["df"].columns)
+    assert second["statistics"] == first["statistics"]
+
+
+def test_schema_sidecar_keeps_time_zone_aware_timestamps(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("id,seen\n1,2024-01-01T10:00:00Z\n2,\n3,2024-03-01T08:30:00Z\n")
+    
+    first = run_graph(path)
+    assert first.get("error") is None
+    sidecar_mtime = main._schema_path(path).stat().st_mtime_ns
+    assert main._read_schema(path)["seen"] == first["df"]["seen"].dtype.pyarrow_dtype
+    
+    second = run_graph(path)
+    assert main._schema_path(path).stat().st_mtime_ns == sidecar_mtime
+    assert second["statistics"] == first["statistics"]
+
+@pytest.mark.parametrize("threshold", [main.STREAMING_THRESHOLD_BYTES, 0], ids=["in_memory", "streaming"])
+def test_most_common_ties_resolve_to_first_occurrence(tmp_path, monkeypatch, threshold):
+    path = tmp_path / "data.csv"
+    path.write_text("letter,word\n" + "".join(f"{letter},{word}\n" for letter, word in zip("bbbaaa", ["q", "r", "s", "r", "q", "s"])))
+    monkeypatch.setattr(main, "STREAMING_THRESHOLD_BYTES", threshold)
+    
+    result = run_graph(path)
+    assert result.get("error") is None
+    assert result["statistics"]["letter"]["most_common"] == "b"
+    assert result["statistics"]["word"]["most_common"] == "q"
+
+
+def test_streaming_counts_match_in_memory_with_quoted_empty_lines(tmp_path, monkeypatch):
+    path = tmp_path / "data.csv"
+    path.write_text('id,note\n1,"line one\n\nline three"\n,\n2,plain\n\n')
+    in_memory = run_graph(path)
+    monkeypatch.setattr(main, "STREAMING_THRESHOLD_BYTES", 0)
+    streamed = run_graph(path)
+    
+    assert in_memory.get("error") is None and streamed.get("error") is None
+    assert streamed["row_count"] == len(in_memory["df"]) == 3
+    for column in ("id", "note"):
+        for key in ("count", "null_count", "unique_count", "most_common", "min_length", "max_length"):
+            assert streamed["statistics"][column].get(key) == in_memory["statistics"][column].get(key)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.random.default_rng(0).normal(size=1001),
+        np.array([4.0, np.nan, 1.0, 7.5, np.nan, -2.0]),
+        np.array([3.25]),
+    ],
+    ids=["random", "nan", "single"],
+)
+def test_fused_stats_match_numpy(values, dtype):
+    column = values.astype(dtype)
+    x = column[~np.isnan(column)].astype(np.float64)
+    mn, mx, mean, std, q25, median, q75 = main._fused_stats(column)
+    
+    rtol = 1e-5 if dtype == np.float32 else 1e-12
+    np.testing.assert_allclose([q25, median, q75], np.percentile(x, [25, 50, 75]), rtol=rtol)
+    np.testing.assert_allclose([mn, mx, mean], [x.min(), x.max(), x.mean()], rtol=rtol)
+    np.testing.assert_allclose(std, x.std(ddof=1) if x.size > 1 else np.nan, rtol=rtol)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_fused_stats_handle_inf_and_all_nan(dtype):
+    mn, mx, mean, std, q25, median, q75 = main._fused_stats(np.array([1.5, np.inf, 2.5], dtype=dtype))
+    assert (mn, mx, mean) == (1.5, np.inf, np.inf)
+    assert np.isnan(std)
+    assert (q25, median, q75) == (2.0, 2.5, np.inf)
+    
+    assert np.isnan(main._fused_stats(np.array([-np.inf, 1.0, np.inf], dtype=dtype))[2])
+    assert np.isnan(main._fused_stats(np.full(3, np.nan, dtype=dtype))).all()